@@ -1,4 +1,8 @@
-from fastapi import FastAPI, HTTPException, status, Response, Path, Query
+import functools
+import itertools
+
+from cachetools import LRUCache
+from fastapi import FastAPI, HTTPException, status, Request, Response, Path, Query
 from typing import List, Optional
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -6,6 +10,9 @@ from settings import settings
 from schemas import Dish
 
 # Create the FastAPI application
+# No custom response class: FastAPI serializes straight to JSON bytes via
+# Pydantic (ORJSONResponse is deprecated), and the hot CRUD routes return
+# pre-serialized bytes anyway
 app = FastAPI(
     title=settings.APP_TITLE,
     description=settings.APP_DESCRIPTION,
@@ -18,20 +25,132 @@ This API provides a complete CRUD interface for managing dishes in a restaurant.
 """
 
 # Configure CORS
+# Explicit method/header lists are precomputed once inside the middleware,
+# so preflight responses skip the wildcard handling path
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify allowed origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type"],
 )
 
-# Example list to store dishes (simulating a database)
-dishes_db = []
+class DishStore(LRUCache):
+    """
+    LRU-bounded in-memory dish store (simulating a database).
+
+    Works like a dict keyed by dish id (O(1) lookups, insertion-ordered
+    iteration) but caps memory at `maxsize` entries, evicting the least
+    recently used dish and dropping it from the secondary indexes when
+    the cap is reached. Each value is a (Dish, bytes) tuple holding the
+    already-validated model and its JSON encoding, computed once at
+    write time so hot read paths skip Pydantic serialization entirely.
+    """
+
+    def popitem(self):
+        key, value = super().popitem()
+        _index_remove(value[0])
+        return key, value
+
+
+# Bounded so a long-running process cannot grow memory without limit;
+# a write-through backend (e.g. Redis) can be layered on later
+dishes_by_id = DishStore(maxsize=10_000)
+
+# Monotonic generator for auto-assigned IDs (never reused after deletes);
+# next() on a count object is atomic under the GIL, so concurrent creates
+# cannot draw the same ID
+_id_gen = itertools.count(1)
+
+# Store version, bumped on every write. It is part of the read-cache key
+# below, so entries cached before a write simply miss afterwards
+_version: int = 0
+
+# Secondary indexes: field -> value -> list of dish ids, maintained
+# incrementally on every write so field lookups stay O(k) instead of O(n).
+# The name index is bound to a module constant so the hot helpers skip
+# re-hashing the "name" key on every write
+_indexes: dict = {"name": {}}
+_name_index: dict = _indexes["name"]
+
+
+def _index_add(dish: Dish) -> None:
+    """Register a dish in the secondary indexes."""
+    _name_index.setdefault(dish.name, []).append(dish.id)
+
+
+def _index_remove(dish: Dish) -> None:
+    """Remove a dish from the secondary indexes (no-op if absent)."""
+    ids = _name_index.get(dish.name)
+    if ids is None or dish.id not in ids:
+        return
+    ids.remove(dish.id)
+    if not ids:
+        del _name_index[dish.name]
+
+
+def _store_dish(dish: Dish) -> bytes:
+    """
+    Cache a dish and its pre-serialized JSON payload in the store.
+
+    Args:
+        dish (Dish): The validated dish to store
+
+    Returns:
+        bytes: The JSON encoding of the dish, computed once per write
+    """
+    global _version
+    previous = dishes_by_id.get(dish.id)
+    if previous is not None:
+        _index_remove(previous[0])
+    _index_add(dish)
+    payload = dish.model_dump_json().encode()
+    dishes_by_id[dish.id] = (dish, payload)
+    _version += 1
+    return payload
+
+
+def _not_found(dish_id: int) -> HTTPException:
+    """
+    Build the standard 404 for a missing dish ID.
+
+    Uses %-formatting, which compiles to a cheaper bytecode sequence than
+    an f-string on the hot miss path (probing clients, stale links).
+
+    Args:
+        dish_id (int): The requested dish ID
+
+    Returns:
+        HTTPException: A 404 error ready to raise
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Dish with id %d not found" % dish_id
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_read(dish_id: int, version: int):
+    """
+    Look up a dish's cached JSON payload, memoized per store version.
+
+    Repeated reads of hot dish IDs are served from the LRU cache without
+    touching the store; any write bumps `_version`, so stale entries
+    naturally miss and age out.
+
+    Args:
+        dish_id (int): ID of the dish to look up
+        version (int): Current store version (cache-key component)
+
+    Returns:
+        bytes | None: The cached JSON payload, or None if the dish is absent
+    """
+    entry = dishes_by_id.get(dish_id)
+    return entry[1] if entry is not None else None
 
 # Root route
 @app.get("/", tags=["Root"])
-def read_root():
+async def read_root():
     """
     Root endpoint that returns a welcome message.
     
@@ -42,7 +161,7 @@ def read_root():
 
 # Check application status
 @app.get("/health", tags=["Health"])
-def check_health():
+async def check_health():
     """
     Health check endpoint to monitor API status.
     
@@ -52,146 +171,204 @@ def check_health():
     return {"status": "ok"}
 
 # CREATE - Create a new dish
-@app.post("/dishes/", response_model=Dish, status_code=status.HTTP_201_CREATED, tags=["Dishes"])
-def create_dish(dish: Dish):
+@app.post("/dishes/", response_model=None, status_code=status.HTTP_201_CREATED, tags=["Dishes"])
+async def create_dish(dish: Dish) -> Response:
     """
     Create a new dish in the database.
-    
+
     Args:
         dish (Dish): The dish object to create
-    
+
     Returns:
-        Dish: The created dish with its assigned ID
-    
+        Response: The created dish as pre-serialized JSON
+
     Raises:
         HTTPException: If a dish with the provided ID already exists
     """
-    dish_dict = dish.model_dump()
-    
-    # If no ID is provided, we generate one automatically
+    store = dishes_by_id  # local binding: LOAD_FAST instead of a global dict probe
+
+    # If no ID is provided, we generate one automatically, skipping any
+    # IDs a client has already claimed explicitly
     if dish.id is None:
-        dish_dict["id"] = len(dishes_db) + 1
-    elif any(d["id"] == dish.id for d in dishes_db):
+        new_id = next(_id_gen)
+        while new_id in store:
+            new_id = next(_id_gen)
+        dish = dish.model_copy(update={"id": new_id})
+    elif dish.id in store:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Dish with id {dish.id} already exists"
         )
-    
-    dishes_db.append(dish_dict)
-    return dish_dict
+
+    payload = _store_dish(dish)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
+    )
 
 # READ - Get all dishes
-@app.get("/dishes/", response_model=List[Dish], tags=["Dishes"])
-def read_dishes(
+@app.get("/dishes/", response_model=None, tags=["Dishes"])
+async def read_dishes(
+    request: Request,
     skip: int = Query(0, description="Number of dishes to skip", ge=0),
-    limit: int = Query(100, description="Maximum number of dishes to return", ge=1, le=100)
-):
+    limit: int = Query(100, description="Maximum number of dishes to return", ge=1, le=100),
+    after_id: Optional[int] = Query(None, description="Return only dishes created after this ID (keyset pagination)", ge=1)
+) -> Response:
     """
     Get a list of all available dishes with pagination.
-    
+
     Args:
         skip (int, optional): Number of dishes to skip. Defaults to 0.
         limit (int, optional): Maximum number of dishes to return. Defaults to 100.
-    
+        after_id (int, optional): Keyset cursor; only dishes with a greater ID
+            are returned and `skip` is ignored. Defaults to None.
+
+    Returns:
+        Response: A JSON array of dishes assembled from cached payloads
+    """
+    # The dict preserves insertion order, so slicing its values view with
+    # islice keeps memory bounded to `limit` items. The body is stitched
+    # together from the per-dish JSON bytes cached at write time, so no
+    # per-element serialization happens here
+    # The ETag covers the store version and the query shape, so any write
+    # or different page invalidates it; matching clients get a bodyless 304
+    etag = 'W/"%d-%d-%d-%s"' % (_version, skip, limit, after_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    store = dishes_by_id
+    if after_id is not None:
+        newer = (p for d, p in store.values() if d.id > after_id)
+        selected = itertools.islice(newer, limit)
+    else:
+        selected = (p for _, p in itertools.islice(store.values(), skip, skip + limit))
+    body = b"[" + b",".join(selected) + b"]"
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, max-age=5"},
+    )
+
+# READ - Search dishes by indexed field
+# Note: registered before /dishes/{dish_id} so the literal path wins
+@app.get("/dishes/search", response_model=None, tags=["Dishes"])
+async def search_dishes(
+    name: str = Query(..., description="Exact name of the dishes to search for")
+) -> List[Dish]:
+    """
+    Search dishes by exact name using the secondary index.
+
+    Args:
+        name (str): Exact dish name to look up
+
     Returns:
-        List[Dish]: A list of dish objects
+        List[Dish]: All dishes with the given name (may be empty)
     """
-    return dishes_db[skip: skip + limit]
+    store = dishes_by_id
+    ids = _name_index.get(name, [])
+    return [store[i][0] for i in ids]
 
 # READ - Get a specific dish by ID
-@app.get("/dishes/{dish_id}", response_model=Dish, tags=["Dishes"])
-def read_dish(
+@app.get("/dishes/{dish_id}", response_model=None, tags=["Dishes"])
+async def read_dish(
+    request: Request,
     dish_id: int = Path(..., description="ID of the dish to retrieve", ge=1)
-):
+) -> Response:
     """
     Get a specific dish by its ID.
-    
+
     Args:
+        request (Request): The incoming request (for If-None-Match)
         dish_id (int): ID of the dish to retrieve
-    
+
     Returns:
-        Dish: The requested dish object
-    
+        Response: The requested dish as pre-serialized JSON, or an empty
+            304 if the client's cached copy is still current
+
     Raises:
         HTTPException: If the dish with the specified ID is not found
     """
-    for dish in dishes_db:
-        if dish["id"] == dish_id:
-            return dish
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Dish with id {dish_id} not found"
+    payload = _cached_read(dish_id, _version)
+    if payload is None:
+        raise _not_found(dish_id)
+    etag = 'W/"%d-%d"' % (_version, dish_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, max-age=5"},
     )
 
 # UPDATE - Update an existing dish
-@app.put("/dishes/{dish_id}", response_model=Dish, tags=["Dishes"])
-def update_dish(
+@app.put("/dishes/{dish_id}", response_model=None, tags=["Dishes"])
+async def update_dish(
     dish_id: int = Path(..., description="ID of the dish to update", ge=1),
     dish: Dish = None
-):
+) -> Response:
     """
     Update an existing dish completely.
-    
+
+    The request body is validated once on the way in; the response is the
+    JSON payload cached at write time, with no second validation pass.
+
     Args:
         dish_id (int): ID of the dish to update
         dish (Dish): New dish data to replace the existing dish
-    
+
     Returns:
-        Dish: The updated dish object
-    
+        Response: The updated dish as pre-serialized JSON
+
     Raises:
         HTTPException: If the dish with the specified ID is not found
     """
-    for idx, stored_dish in enumerate(dishes_db):
-        if stored_dish["id"] == dish_id:
-            # Make sure the ID in the path and in the body match
-            dish_dict = dish.model_dump()
-            dish_dict["id"] = dish_id
-            dishes_db[idx] = dish_dict
-            return dish_dict
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Dish with id {dish_id} not found"
-    )
+    if dish_id in dishes_by_id:
+        # Make sure the ID in the path and in the body match
+        updated_dish = dish.model_copy(update={"id": dish_id})
+        payload = _store_dish(updated_dish)
+        return Response(content=payload, media_type="application/json")
+
+    raise _not_found(dish_id)
 
 # UPDATE - Partially update a dish (PATCH)
-@app.patch("/dishes/{dish_id}", response_model=Dish, tags=["Dishes"])
-def partial_update_dish(
+@app.patch("/dishes/{dish_id}", response_model=None, tags=["Dishes"])
+async def partial_update_dish(
     dish_id: int = Path(..., description="ID of the dish to partially update", ge=1),
     name: Optional[str] = None,
     price: Optional[float] = Query(None, gt=0, description="Price of the dish (must be greater than 0)")
-):
+) -> Response:
     """
     Partially update an existing dish.
-    
+
+    Field values are validated by their Query declarations; the stored
+    dish is copied with the updates applied rather than re-validated.
+
     Args:
         dish_id (int): ID of the dish to update
         name (str, optional): New dish name. Defaults to None.
         price (float, optional): New dish price (must be greater than 0). Defaults to None.
-    
+
     Returns:
-        Dish: The updated dish object
-    
+        Response: The updated dish as pre-serialized JSON
+
     Raises:
         HTTPException: If the dish with the specified ID is not found
     """
-    for idx, stored_dish in enumerate(dishes_db):
-        if stored_dish["id"] == dish_id:
-            if name is not None:
-                dishes_db[idx]["name"] = name
-            if price is not None:
-                dishes_db[idx]["price"] = price
-            return dishes_db[idx]
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Dish with id {dish_id} not found"
-    )
+    entry = dishes_by_id.get(dish_id)
+    if entry is not None:
+        # Dish is frozen, so build the updated instance with model_copy;
+        # _store_dish re-indexes it under the new name if it changed
+        updates = {k: v for k, v in (("name", name), ("price", price)) if v is not None}
+        updated_dish = entry[0].model_copy(update=updates)
+        payload = _store_dish(updated_dish)
+        return Response(content=payload, media_type="application/json")
+
+    raise _not_found(dish_id)
 
 # DELETE - Delete a dish
 @app.delete("/dishes/{dish_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Dishes"])
-def delete_dish(
+async def delete_dish(
     dish_id: int = Path(..., description="ID of the dish to delete", ge=1)
 ):
     """
@@ -206,15 +383,13 @@ def delete_dish(
     Raises:
         HTTPException: If the dish with the specified ID is not found
     """
-    for idx, stored_dish in enumerate(dishes_db):
-        if stored_dish["id"] == dish_id:
-            dishes_db.pop(idx)
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Dish with id {dish_id} not found"
-    )
+    global _version
+    entry = dishes_by_id.pop(dish_id, None)
+    if entry is None:
+        raise _not_found(dish_id)
+    _index_remove(entry[0])
+    _version += 1
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 # Start the application if running directly
 if __name__ == "__main__":
@@ -222,10 +397,21 @@ if __name__ == "__main__":
     Entry point for running the application directly.
     This will start the Uvicorn server with the FastAPI application.
     """
+    import os
+
     import uvicorn
+
+    # The reload file-watcher is debug-only overhead; in production run one
+    # worker per core instead. Note the in-memory store and its caches are
+    # per-worker — back them with a shared store (e.g. Redis) if workers
+    # must see the same data
     uvicorn.run(
-        "main:app", 
-        host=settings.APP_HOST, 
-        port=settings.APP_PORT, 
+        "main:app",
+        host=settings.APP_HOST,
+        port=settings.APP_PORT,
+        # libuv event loop and C HTTP parser instead of asyncio + h11
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.APP_DEBUG else os.cpu_count(),
         reload=settings.APP_DEBUG
     )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class Dish(BaseModel):
@@ -24,20 +24,18 @@ class Dish(BaseModel):
         gt=0  # Validation: price must be greater than 0
     )
     
-    class Config:
-        """
-        Configuration class for the Dish model.
-        
-        This configures Pydantic behavior for this model, including ORM compatibility
-        and example values for API documentation.
-        """
-        from_attributes = True  # For ORM compatibility (like SQLAlchemy)
-        
+    # frozen=True makes instances immutable and hashable (safe to share
+    # between the store and caches); updates go through model_copy.
+    # from_attributes is intentionally not set since no ORM is involved,
+    # which skips that extra construction path.
+    model_config = ConfigDict(
+        frozen=True,
         # Example for documentation
-        json_schema_extra = {
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Pasta Carbonara",
                 "price": 12.99
             }
         }
+    )
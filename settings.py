@@ -1,17 +1,18 @@
-import os
-from pydantic import BaseModel
-from dotenv import load_dotenv
+import functools
 
-# Load environment variables from .env file
-load_dotenv()
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings(BaseModel):
+
+class Settings(BaseSettings):
     """
     Application settings configuration.
-    
+
     This class handles all configuration settings for the application,
-    loading values from environment variables with sensible defaults.
-    
+    loading values from the environment (and `.env`) with sensible
+    defaults. The instance is frozen, so settings cannot drift at
+    runtime, and pydantic-settings parses the environment exactly once
+    at construction.
+
     Attributes:
         APP_TITLE (str): The title of the application
         APP_DESCRIPTION (str): A description of the application
@@ -24,19 +25,34 @@ class Settings(BaseModel):
     APP_TITLE: str = "Dish Management API"
     APP_DESCRIPTION: str = "An API for managing restaurant dishes"
     APP_VERSION: str = "0.1.0"
-    
+
     # Server configuration
-    APP_HOST: str = os.getenv("APP_HOST", "0.0.0.0")
-    APP_PORT: int = int(os.getenv("APP_PORT", "8000"))
-    APP_DEBUG: bool = os.getenv("APP_DEBUG", "true").lower() == "true"
-    
+    APP_HOST: str = "0.0.0.0"
+    APP_PORT: int = 8000
+    APP_DEBUG: bool = True
+
     # Other configurations can be added here
-    # DATABASE_URL: str = os.getenv("DATABASE_URL", "")
-    
-    model_config = {
-        "env_file": ".env"
-    }
+    # DATABASE_URL: str = ""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        frozen=True,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    The lru_cache guarantees Settings() is constructed (and the
+    environment parsed) exactly once per worker process.
+
+    Returns:
+        Settings: The cached application settings
+    """
+    return Settings()
 
 
 # Create a settings instance to import in other files
-settings = Settings()
+settings = get_settings()